@@ -3,23 +3,51 @@ from fastapi.responses import HTMLResponse, JSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from fastapi.middleware.cors import CORSMiddleware
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from datetime import datetime, timezone
+import asyncio
+import contextlib
 import os
+import msgspec
 
 from .scraper.models import ScrapeRequest, ScrapeResponse, ScrapeResult, Interactions
-from .scraper.static_scraper import static_scrape
-from .scraper.js_scraper import js_scrape
+from .scraper.static_scraper import static_scrape, create_http_transport
+from .scraper.js_scraper import js_scrape, merge_sections, likely_needs_js
+from .scraper.browser import browser_manager
 
-app = FastAPI(title="Universal Web Scraper", version="1.0.0")
+class MsgspecJSONResponse(JSONResponse):
+    def render(self, content) -> bytes:
+        return msgspec.json.encode(content)
 
-class NoCacheMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        response = await call_next(request)
-        response.headers["Cache-Control"] = "no-cache, no-store, must-revalidate"
-        response.headers["Pragma"] = "no-cache"
-        response.headers["Expires"] = "0"
-        return response
+
+app = FastAPI(
+    title="Universal Web Scraper",
+    version="1.0.0",
+    default_response_class=MsgspecJSONResponse
+)
+
+class NoCacheMiddleware:
+    # Plain ASGI rather than BaseHTTPMiddleware so the pre-encoded /scrape body
+    # goes straight out instead of being re-streamed through a memory channel.
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        async def send_no_cache(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message.setdefault("headers", [])
+                headers = MutableHeaders(scope=message)
+                headers["Cache-Control"] = "no-cache, no-store, must-revalidate"
+                headers["Pragma"] = "no-cache"
+                headers["Expires"] = "0"
+            await send(message)
+        
+        await self.app(scope, receive, send_no_cache)
 
 app.add_middleware(NoCacheMiddleware)
 app.add_middleware(
@@ -37,33 +65,72 @@ templates = Jinja2Templates(directory=templates_dir)
 app.mount("/static", StaticFiles(directory=static_dir), name="static")
 
 
+@app.on_event("startup")
+async def start_http_transport():
+    app.state.http_transport = create_http_transport()
+
+
+@app.on_event("shutdown")
+async def stop_http_transport():
+    await app.state.http_transport.aclose()
+
+
+@app.on_event("startup")
+async def start_browser():
+    try:
+        await browser_manager.startup()
+    except Exception:
+        # Static scraping still works without Chromium; the first JS scrape
+        # retries the launch and reports the failure as a render error.
+        pass
+
+
+@app.on_event("shutdown")
+async def stop_browser():
+    await browser_manager.shutdown()
+
+
 @app.get("/healthz")
 async def health_check():
     return {"status": "ok"}
 
 
-@app.post("/scrape", response_model=ScrapeResponse)
+@app.post("/scrape")
 async def scrape_url(request: ScrapeRequest):
     url = request.url
     scraped_at = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
     
-    metadata, sections, errors, html_content, needs_js = await static_scrape(url)
+    # Only URLs that are almost certainly client-rendered start rendering
+    # speculatively, and only when the shared browser is already up, so a
+    # static page never holds a browser slot or fetches the page twice. The
+    # task is cancelled below if the static DOM turns out to be enough.
+    js_task = None
+    if browser_manager.is_running and likely_needs_js(url):
+        js_task = asyncio.create_task(js_scrape(url))
+    try:
+        metadata, sections, errors, html_content, needs_js = await static_scrape(url, app.state.http_transport)
+    except BaseException:
+        if js_task:
+            js_task.cancel()
+        raise
     
     interactions = Interactions(clicks=[], scrolls=0, pages=[url])
     
     if needs_js or not sections:
-        js_metadata, js_sections, js_errors, js_interactions = await js_scrape(
-            url,
-            existing_metadata=metadata if metadata.title else None,
-            existing_sections=sections
-        )
+        if js_task is None:
+            js_task = asyncio.create_task(js_scrape(url))
+        js_metadata, js_sections, js_errors, js_interactions = await js_task
         
-        if js_metadata and js_metadata.title:
+        if not metadata.title and js_metadata and js_metadata.title:
             metadata = js_metadata
         if js_sections:
-            sections = js_sections
+            sections = merge_sections(sections, js_sections)
         errors.extend(js_errors)
         interactions = js_interactions
+    elif js_task:
+        js_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await js_task
     
     result = ScrapeResult(
         url=url,
@@ -74,7 +141,7 @@ async def scrape_url(request: ScrapeRequest):
         errors=errors
     )
     
-    return ScrapeResponse(result=result)
+    return MsgspecJSONResponse(content=ScrapeResponse(result=result))
 
 
 @app.get("/", response_class=HTMLResponse)
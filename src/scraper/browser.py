@@ -0,0 +1,51 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+from playwright.async_api import async_playwright, Browser, BrowserContext, Playwright
+
+MAX_CONCURRENT_CONTEXTS = 4
+
+
+class BrowserManager:
+    """Keeps one headless Chromium alive and hands out a fresh context per scrape."""
+
+    def __init__(self, max_contexts: int = MAX_CONCURRENT_CONTEXTS):
+        self._playwright: Optional[Playwright] = None
+        self._browser: Optional[Browser] = None
+        self._lock = asyncio.Lock()
+        self._semaphore = asyncio.Semaphore(max_contexts)
+
+    @property
+    def is_running(self) -> bool:
+        return self._browser is not None and self._browser.is_connected()
+
+    async def startup(self) -> None:
+        async with self._lock:
+            if self.is_running:
+                return
+            if self._playwright is None:
+                self._playwright = await async_playwright().start()
+            self._browser = await self._playwright.chromium.launch(headless=True)
+
+    async def shutdown(self) -> None:
+        async with self._lock:
+            if self._browser:
+                await self._browser.close()
+                self._browser = None
+            if self._playwright:
+                await self._playwright.stop()
+                self._playwright = None
+
+    @asynccontextmanager
+    async def new_context(self, **kwargs) -> AsyncIterator[BrowserContext]:
+        async with self._semaphore:
+            if not self.is_running:
+                await self.startup()
+            context = await self._browser.new_context(**kwargs)
+            try:
+                yield context
+            finally:
+                await context.close()
+
+
+browser_manager = BrowserManager()
@@ -1,10 +1,17 @@
 import asyncio
-from typing import List, Tuple
-from playwright.async_api import async_playwright, Page, Browser
-from selectolax.parser import HTMLParser
-from .models import MetaData, Section, ErrorItem, Interactions
+import re
+from typing import List, NamedTuple, Optional, Tuple
+from urllib.parse import urljoin, urlsplit
+from playwright.async_api import ElementHandle, Page, Route
+from selectolax.lexbor import LexborHTMLParser as HTMLParser
+from .models import (
+    MetaData, Section, SectionContent, LinkItem, ImageItem, ErrorItem, Interactions
+)
+from .browser import browser_manager
 from .static_scraper import (
-    extract_metadata, extract_sections, remove_noise
+    extract_metadata, extract_sections, remove_noise, make_section, _absolute_url,
+    generate_label, NOISE_SELECTOR_GROUP, SECTION_SELECTORS, RAW_HTML_LIMIT,
+    FALLBACK_TEXT_LIMIT, MAX_LINKS, MAX_IMAGES, MAX_LISTS, MAX_TABLES
 )
 
 TAB_SELECTORS = [
@@ -36,47 +43,437 @@ PAGINATION_SELECTORS = [
     'a.next'
 ]
 
+PAGE_DEFAULT_TIMEOUT = 5000
+
+# Hits are located up front, so a click whose target went stale after an
+# earlier click should give up quickly instead of waiting out the default.
+CLICK_TIMEOUT = 1000
+
+# Hash-routed URLs ("#/route", "#!/route") are resolved entirely in the
+# browser, since the fragment never reaches the server.
+CLIENT_ROUTE_RE = re.compile(r'#!?/')
+
+# Only the DOM is scraped, so these are pure transfer cost. Stylesheets still
+# load because visibility checks and scroll height depend on layout.
+BLOCKED_RESOURCE_TYPES = {'image', 'font', 'media'}
+
+
+# Resolves every selector in one round trip and returns the visible matches
+# themselves, so callers click element handles instead of re-resolving a
+# locator. The matching follows Playwright's engine: open shadow roots are
+# searched, :has-text() (not valid CSS) compares case-insensitive text with
+# whitespace collapsed, and an element is visible when it has a non-empty box
+# and is not visibility: hidden, as ElementHandle.is_visible() checks. Each
+# element is reported for the first selector that matches it only.
+VISIBLE_MATCHES_JS = """
+([selectors, limit]) => {
+    const roots = [document];
+    for (let i = 0; i < roots.length; i++) {
+        const walker = document.createTreeWalker(roots[i], NodeFilter.SHOW_ELEMENT);
+        let node;
+        while ((node = walker.nextNode())) {
+            if (node.shadowRoot) roots.push(node.shadowRoot);
+        }
+    }
+    const normalize = (text) => text.replace(/\\s+/g, ' ').trim().toLowerCase();
+    const isVisible = (el) => {
+        const rect = el.getBoundingClientRect();
+        return rect.width > 0 && rect.height > 0 && getComputedStyle(el).visibility !== 'hidden';
+    };
+
+    const claimed = new Set();
+    const elements = [];
+    const matches = [];
+    selectors.forEach((sel, selectorIndex) => {
+        const textMatch = sel.match(/^(.*):has-text\\("(.*)"\\)$/);
+        let found;
+        try {
+            found = roots.flatMap((root) => [...root.querySelectorAll(textMatch ? (textMatch[1] || '*') : sel)]);
+        } catch (e) {
+            return;
+        }
+        if (textMatch) {
+            const needle = normalize(textMatch[2]);
+            found = found.filter((el) => normalize(el.textContent || '').includes(needle));
+        }
+        let hits = 0;
+        for (const el of found) {
+            if (hits >= limit) break;
+            if (claimed.has(el) || !isVisible(el)) continue;
+            claimed.add(el);
+            elements.push(el);
+            matches.push([selectorIndex, el.getAttribute('href')]);
+            hits++;
+        }
+    });
+    return {elements, matches};
+}
+"""
+
+
+# Mirrors remove_noise, extract_metadata and extract_sections against the live
+# DOM so the rendered page never has to be serialized and parsed again. Text is
+# joined from stripped text nodes like selectolax's text(strip=True), sections
+# are gathered selector by selector like the Lexbor group query, and hrefs are
+# returned raw so Python resolves them exactly as the static path does.
+EXTRACT_JS = """
+([noiseSelector, sectionSelectors, limits]) => {
+    document.querySelectorAll(noiseSelector).forEach((el) => el.remove());
+
+    const textNodes = (root) => {
+        const walker = document.createTreeWalker(root, NodeFilter.SHOW_TEXT);
+        const parts = [];
+        let node;
+        while ((node = walker.nextNode())) {
+            const text = node.data.trim();
+            if (text) {
+                parts.push(text);
+            }
+        }
+        return parts;
+    };
+    const stripText = (root) => textNodes(root).join('');
+
+    const enclosing = (node, root, containers) => {
+        const found = [];
+        for (let parent = node.parentElement; parent && parent !== root; parent = parent.parentElement) {
+            const container = containers.get(parent);
+            if (container) {
+                found.push(container);
+            }
+        }
+        return found;
+    };
+
+    // Bucketed by tag like extract_section_content: h1s before h2s, <ul>
+    // before <ol>, and <th> before <td> within a row.
+    const buckets = (tags) => new Map(tags.map((tag) => [tag, []]));
+    const flatten = (groups) => [...groups.values()].flat();
+
+    const extractContent = (root) => {
+        const headings = buckets(['h1', 'h2', 'h3', 'h4', 'h5', 'h6']);
+        const textParts = [];
+        const links = [];
+        const images = [];
+        const listGroups = buckets(['ul', 'ol']);
+        const lists = new Map();
+        const tables = new Map();
+        const rows = new Map();
+        const walker = document.createTreeWalker(root, NodeFilter.SHOW_ELEMENT);
+        let node;
+        while ((node = walker.nextNode())) {
+            const tag = node.localName;
+            if (headings.has(tag)) {
+                const text = stripText(node);
+                if (text) headings.get(tag).push(text);
+            } else if (tag === 'p') {
+                const text = stripText(node);
+                if (text) textParts.push(text);
+            } else if (tag === 'a') {
+                const href = node.getAttribute('href');
+                if (links.length < limits.links && href && !/^(#|javascript:|mailto:|tel:)/.test(href)) {
+                    links.push({text: stripText(node), href});
+                }
+            } else if (tag === 'img') {
+                const src = node.getAttribute('src');
+                if (images.length < limits.images && src) {
+                    images.push({src, alt: node.getAttribute('alt') || ''});
+                }
+            } else if (listGroups.has(tag)) {
+                const items = [];
+                lists.set(node, items);
+                listGroups.get(tag).push(items);
+            } else if (tag === 'li') {
+                const containers = enclosing(node, root, lists);
+                if (containers.length) {
+                    const text = stripText(node);
+                    if (text) containers.forEach((items) => items.push(text));
+                }
+            } else if (tag === 'table') {
+                tables.set(node, []);
+            } else if (tag === 'tr') {
+                const row = buckets(['th', 'td']);
+                rows.set(node, row);
+                enclosing(node, root, tables).forEach((tableData) => tableData.push(row));
+            } else if (tag === 'th' || tag === 'td') {
+                const containers = enclosing(node, root, rows);
+                if (containers.length) {
+                    const text = stripText(node);
+                    containers.forEach((row) => row.get(tag).push(text));
+                }
+            }
+        }
+
+        // The fallback is cut in Python, which counts code points; 2 * limit
+        // UTF-16 units always hold at least `limit` of them.
+        let fallbackText = '';
+        if (!textParts.length) {
+            for (const part of textNodes(root)) {
+                fallbackText += part;
+                if (fallbackText.length >= 2 * limits.fallbackText) break;
+            }
+        }
+
+        return {
+            headings: flatten(headings),
+            text: textParts.join(' '),
+            fallbackText,
+            links,
+            images,
+            lists: flatten(listGroups).filter((items) => items.length).slice(0, limits.lists),
+            tables: [...tables.values()]
+                .map((tableData) => tableData.map(flatten).filter((row) => row.length))
+                .filter((tableData) => tableData.length)
+                .slice(0, limits.tables),
+        };
+    };
+
+    // Serializes only as much of a node as the preview needs, like
+    // truncated_html. Tags come from a shallow clone's outerHTML, so they
+    // match the browser's own serialization without serializing the subtree.
+    const RAW_TEXT_TAGS = new Set(['style', 'script', 'xmp', 'iframe', 'noembed', 'noframes', 'plaintext', 'noscript']);
+    const escapeText = (text) => text
+        .replace(/&/g, '&amp;').replace(/\u00a0/g, '&nbsp;').replace(/</g, '&lt;').replace(/>/g, '&gt;');
+    const writeHtml = (node, parts, budget) => {
+        if (node.nodeType === Node.TEXT_NODE) {
+            const parent = node.parentNode;
+            const text = node.data.slice(0, budget);
+            const html = parent && RAW_TEXT_TAGS.has(parent.localName) ? text : escapeText(text);
+            parts.push(html);
+            return budget - html.length;
+        }
+        if (node.nodeType === Node.COMMENT_NODE) {
+            const html = `<!--${node.data}-->`;
+            parts.push(html);
+            return budget - html.length;
+        }
+        if (node.nodeType !== Node.ELEMENT_NODE) {
+            return budget;
+        }
+
+        const shell = node.cloneNode(false).outerHTML;
+        const end = `</${node.localName}>`;
+        if (!shell.endsWith(end)) {
+            parts.push(shell);
+            return budget - shell.length;
+        }
+        const start = shell.slice(0, -end.length);
+        parts.push(start);
+        budget -= start.length;
+        const children = node.localName === 'template' ? node.content.childNodes : node.childNodes;
+        for (const child of children) {
+            if (budget <= 0) {
+                return budget;
+            }
+            budget = writeHtml(child, parts, budget);
+        }
+        parts.push(end);
+        return budget - end.length;
+    };
+
+    // 2 * (limit + 1) UTF-16 units hold at least limit + 1 code points, and
+    // iterating a string walks code points, so the preview never ends in half
+    // of a surrogate pair. One extra code point tells Python it was cut.
+    const htmlPrefix = (el) => {
+        const parts = [];
+        writeHtml(el, parts, 2 * (limits.rawHtml + 1));
+        let html = '';
+        let count = 0;
+        for (const ch of parts.join('')) {
+            if (count++ > limits.rawHtml) break;
+            html += ch;
+        }
+        return html;
+    };
+
+    const describe = (el, content) => ({
+        tag: el.localName,
+        attributes: {
+            'class': el.getAttribute('class') || '',
+            'id': el.getAttribute('id') || '',
+            'aria-label': el.getAttribute('aria-label') || '',
+        },
+        content,
+        rawHtml: htmlPrefix(el),
+    });
+
+    const sections = [];
+    for (const selector of sectionSelectors) {
+        for (const el of document.querySelectorAll(selector)) {
+            const content = extractContent(el);
+            if (content.text || content.fallbackText || content.headings.length || content.links.length) {
+                sections.push(describe(el, content));
+            }
+        }
+    }
+    let fallback = null;
+    if (!sections.length && document.body) {
+        fallback = describe(document.body, extractContent(document.body));
+    }
+
+    const head = document.head || document.documentElement;
+    const first = (selector) => (head ? head.querySelector(selector) : null);
+    const title = first('title');
+    const ogTitle = first('meta[property="og:title"]');
+    const description = first('meta[name="description"]');
+    const canonical = first('link[rel="canonical"]');
+
+    return {
+        meta: {
+            title: title ? stripText(title) : '',
+            ogTitle: ogTitle ? ogTitle.getAttribute('content') || '' : '',
+            description: description ? description.getAttribute('content') || '' : '',
+            language: document.documentElement.getAttribute('lang') || '',
+            canonical: canonical ? canonical.getAttribute('href') || '' : '',
+        },
+        sections,
+        fallback,
+    };
+}
+"""
+
+
+# Installs (once per document) a MutationObserver that records when the DOM
+# last changed, and returns the current timestamp to wait from.
+MARK_DOM_JS = """
+() => {
+    if (!window.__scraperObserver) {
+        window.__scraperLastMutation = 0;
+        window.__scraperObserver = new MutationObserver(() => {
+            window.__scraperLastMutation = performance.now();
+        });
+        window.__scraperObserver.observe(document.documentElement, {
+            childList: true, subtree: true, attributes: true, characterData: true
+        });
+    }
+    return performance.now();
+}
+"""
+
+# True once the DOM has been quiet for `quiet` ms since `since`; with
+# `needChange` it also requires at least one mutation after `since`.
+DOM_SETTLED_JS = """
+([since, quiet, needChange]) => {
+    const last = window.__scraperLastMutation || 0;
+    if (needChange && last <= since) {
+        return false;
+    }
+    return performance.now() - Math.max(last, since) >= quiet;
+}
+"""
+
+DOM_QUIET_MS = 150
+
+
+async def block_heavy_resources(route: Route) -> None:
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def find_visible(
+    page: Page, selectors: List[str], limit: int = 1
+) -> List[List[Tuple[ElementHandle, Optional[str]]]]:
+    """Return up to ``limit`` visible ``(element, href)`` hits per selector."""
+    result = await page.evaluate_handle(VISIBLE_MATCHES_JS, [selectors, limit])
+    try:
+        matches = await result.evaluate('result => result.matches')
+        elements = await (await result.get_property('elements')).get_properties()
+    finally:
+        await result.dispose()
+    
+    hits = [[] for _ in selectors]
+    for i, (selector_index, href) in enumerate(matches):
+        hits[selector_index].append((elements[str(i)].as_element(), href))
+    return hits
+
+
+async def mark_dom(page: Page) -> float:
+    try:
+        return await page.evaluate(MARK_DOM_JS)
+    except Exception:
+        return 0.0
+
+
+async def wait_for_dom_settle(page: Page, since: float, timeout: int, need_change: bool = True) -> None:
+    """Wait until the DOM stops changing, giving up after ``timeout`` ms.
+
+    With ``need_change`` the wait only ends early once something actually
+    changed after ``since``, so a click whose effect lands a little later
+    still gets the full ``timeout`` to show up.
+    """
+    try:
+        await page.wait_for_function(
+            DOM_SETTLED_JS,
+            arg=[since, DOM_QUIET_MS, need_change],
+            timeout=timeout,
+            polling=50
+        )
+    except Exception:
+        pass
+
 
 async def click_tabs(page: Page, interactions: Interactions, errors: List[ErrorItem]) -> None:
-    for selector in TAB_SELECTORS:
-        try:
-            tabs = await page.query_selector_all(selector)
-            for i, tab in enumerate(tabs[:3]):
-                try:
-                    if await tab.is_visible():
-                        await tab.click()
-                        interactions.clicks.append(selector)
-                        await page.wait_for_timeout(500)
-                except Exception:
-                    pass
-        except Exception as e:
-            errors.append(ErrorItem(message=f"Tab click error: {str(e)[:50]}", phase="interaction"))
+    try:
+        matches = await find_visible(page, TAB_SELECTORS, limit=3)
+    except Exception as e:
+        errors.append(ErrorItem(message=f"Tab click error: {str(e)[:50]}", phase="interaction"))
+        return
+    
+    for selector, hits in zip(TAB_SELECTORS, matches):
+        for element, _ in hits:
+            try:
+                since = await mark_dom(page)
+                await element.click(timeout=CLICK_TIMEOUT)
+                interactions.clicks.append(selector)
+                await wait_for_dom_settle(page, since, timeout=500)
+            except Exception:
+                pass
 
 
 async def click_load_more(page: Page, interactions: Interactions, errors: List[ErrorItem]) -> None:
-    for selector in LOAD_MORE_SELECTORS:
+    pending = list(LOAD_MORE_SELECTORS)
+    for _ in range(3):
         try:
-            for _ in range(3):
-                try:
-                    button = await page.query_selector(selector)
-                    if button and await button.is_visible():
-                        await button.click()
-                        interactions.clicks.append(selector)
-                        await page.wait_for_timeout(1000)
-                    else:
-                        break
-                except Exception:
-                    break
+            matches = await find_visible(page, pending)
         except Exception as e:
             errors.append(ErrorItem(message=f"Load more error: {str(e)[:50]}", phase="interaction"))
+            break
+        
+        still_pending = []
+        for selector, hits in zip(pending, matches):
+            if not hits:
+                continue
+            try:
+                since = await mark_dom(page)
+                element, _ = hits[0]
+                await element.click(timeout=CLICK_TIMEOUT)
+                interactions.clicks.append(selector)
+                await wait_for_dom_settle(page, since, timeout=1000)
+                still_pending.append(selector)
+            except Exception:
+                pass
+        if not still_pending:
+            break
+        pending = still_pending
 
 
 async def perform_scrolls(page: Page, interactions: Interactions, errors: List[ErrorItem], scroll_count: int = 3) -> None:
     try:
         for i in range(scroll_count):
+            height = await page.evaluate('document.body.scrollHeight')
             await page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
             interactions.scrolls += 1
-            await page.wait_for_timeout(1500)
+            try:
+                await page.wait_for_function(
+                    'height => document.body.scrollHeight > height',
+                    arg=height,
+                    timeout=1500
+                )
+            except Exception:
+                # Nothing new was appended, so further scrolling won't help.
+                break
             
             try:
                 await page.wait_for_load_state('networkidle', timeout=3000)
@@ -92,26 +489,28 @@ async def follow_pagination(page: Page, interactions: Interactions, errors: List
     for _ in range(max_pages - 1):
         next_link = None
         
-        for selector in PAGINATION_SELECTORS:
-            try:
-                link = await page.query_selector(selector)
-                if link and await link.is_visible():
-                    href = await link.get_attribute('href')
-                    if href and href not in visited_urls:
-                        next_link = link
-                        break
-            except Exception:
-                continue
+        try:
+            matches = await find_visible(page, PAGINATION_SELECTORS)
+        except Exception:
+            break
+        
+        for hits in matches:
+            if hits and hits[0][1] and hits[0][1] not in visited_urls:
+                next_link = hits[0][0]
+                break
         
         if not next_link:
             break
         
         try:
-            await next_link.click()
+            await next_link.click(timeout=CLICK_TIMEOUT)
             try:
                 await page.wait_for_load_state('networkidle', timeout=5000)
             except Exception:
-                await page.wait_for_timeout(2000)
+                try:
+                    await page.wait_for_load_state('domcontentloaded', timeout=2000)
+                except Exception:
+                    pass
             
             current_url = page.url
             if current_url not in visited_urls:
@@ -123,6 +522,124 @@ async def follow_pagination(page: Page, interactions: Interactions, errors: List
     return visited_urls
 
 
+class RenderedElement(NamedTuple):
+    """The ``tag``/``attributes`` view of an in-browser element that section typing and labels need."""
+    tag: str
+    attributes: dict
+
+
+def likely_needs_js(url: str) -> bool:
+    return bool(CLIENT_ROUTE_RE.search(url))
+
+
+def parse_rendered(html_content: str, url: str) -> Tuple[MetaData, List[Section]]:
+    tree = HTMLParser(html_content)
+    remove_noise(tree)
+    return extract_metadata(tree, url), extract_sections(tree, url)
+
+
+def _rendered_content(content: dict, url: str, scheme_prefix: str) -> SectionContent:
+    return SectionContent(
+        headings=content['headings'],
+        text=content['text'] or content['fallbackText'][:FALLBACK_TEXT_LIMIT],
+        links=[
+            LinkItem(text=link['text'] or link['href'], href=_absolute_url(link['href'], url, scheme_prefix))
+            for link in content['links']
+        ],
+        images=[
+            ImageItem(src=_absolute_url(image['src'], url, scheme_prefix), alt=image['alt'])
+            for image in content['images']
+        ],
+        lists=content['lists'],
+        tables=content['tables']
+    )
+
+
+EXTRACT_ARGS = [
+    NOISE_SELECTOR_GROUP,
+    SECTION_SELECTORS,
+    {
+        'links': MAX_LINKS,
+        'images': MAX_IMAGES,
+        'lists': MAX_LISTS,
+        'tables': MAX_TABLES,
+        'rawHtml': RAW_HTML_LIMIT,
+        'fallbackText': FALLBACK_TEXT_LIMIT,
+    }
+]
+
+
+def _rendered_html(raw_html: str) -> Tuple[str, bool]:
+    if len(raw_html) > RAW_HTML_LIMIT:
+        return raw_html[:RAW_HTML_LIMIT] + "...", True
+    return raw_html, False
+
+
+def build_rendered(extracted: dict, url: str) -> Tuple[MetaData, List[Section]]:
+    meta = extracted['meta']
+    canonical = meta['canonical']
+    metadata = MetaData(
+        title=meta['ogTitle'] or meta['title'],
+        description=meta['description'],
+        language=meta['language'],
+        canonical=urljoin(url, canonical) if canonical else ""
+    )
+    
+    scheme_prefix = f"{urlsplit(url).scheme}:"
+    sections = []
+    section_counts = {}
+    for item in extracted['sections']:
+        element = RenderedElement(item['tag'], item['attributes'])
+        content = _rendered_content(item['content'], url, scheme_prefix)
+        raw_html, truncated = _rendered_html(item['rawHtml'])
+        sections.append(make_section(
+            element, content, url, raw_html, truncated, section_counts
+        ))
+    
+    fallback = extracted['fallback']
+    if fallback:
+        element = RenderedElement(fallback['tag'], fallback['attributes'])
+        content = _rendered_content(fallback['content'], url, scheme_prefix)
+        raw_html, truncated = _rendered_html(fallback['rawHtml'])
+        sections.append(Section(
+            id="body-0",
+            type="unknown",
+            label=generate_label(element, content),
+            sourceUrl=url,
+            content=content,
+            rawHtml=raw_html,
+            truncated=truncated
+        ))
+    
+    return metadata, sections
+
+
+async def extract_rendered(page: Page, url: str) -> Tuple[MetaData, List[Section]]:
+    """Extract from the live DOM, falling back to parsing ``page.content()``."""
+    try:
+        extracted = await page.evaluate(EXTRACT_JS, EXTRACT_ARGS)
+        return build_rendered(extracted, url)
+    except Exception:
+        html_content = await page.content()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, parse_rendered, html_content, url)
+
+
+def merge_sections(sections: List[Section], js_sections: List[Section]) -> List[Section]:
+    existing_by_id = {}
+    for i, s in enumerate(sections):
+        existing_by_id.setdefault(s.id, i)
+    
+    for sec in js_sections:
+        idx = existing_by_id.get(sec.id)
+        if idx is None:
+            existing_by_id[sec.id] = len(sections)
+            sections.append(sec)
+        elif len(sec.content.text) > len(sections[idx].content.text):
+            sections[idx] = sec
+    return sections
+
+
 async def js_scrape(
     url: str,
     existing_metadata: MetaData = None,
@@ -133,61 +650,51 @@ async def js_scrape(
     metadata = existing_metadata or MetaData()
     sections = existing_sections or []
     
-    browser: Browser = None
-    
     try:
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            context = await browser.new_context(
-                viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            )
+        async with browser_manager.new_context(
+            viewport={'width': 1920, 'height': 1080},
+            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            service_workers='block',
+            java_script_enabled=True,
+            bypass_csp=True
+        ) as context:
+            await context.route("**/*", block_heavy_resources)
             page = await context.new_page()
+            # Operations without an explicit timeout (clicks, locators) must
+            # not be able to stall a scrape for Playwright's 30s default.
+            page.set_default_timeout(PAGE_DEFAULT_TIMEOUT)
             
             try:
-                await page.goto(url, wait_until='networkidle', timeout=15000)
-            except Exception as e:
                 try:
-                    await page.goto(url, wait_until='domcontentloaded', timeout=10000)
-                except Exception as e2:
-                    errors.append(ErrorItem(message=f"Navigation failed: {str(e2)[:50]}", phase="render"))
-                    return metadata, sections, errors, interactions
-            
-            await page.wait_for_timeout(1000)
-            
-            await click_tabs(page, interactions, errors)
-            await click_load_more(page, interactions, errors)
-            await perform_scrolls(page, interactions, errors, scroll_count=3)
-            
-            await follow_pagination(page, interactions, errors, max_pages=3)
-            
-            html_content = await page.content()
-            
-            try:
-                tree = HTMLParser(html_content)
-                remove_noise(tree)
+                    await page.goto(url, wait_until='networkidle', timeout=15000)
+                except Exception as e:
+                    try:
+                        await page.goto(url, wait_until='domcontentloaded', timeout=10000)
+                    except Exception as e2:
+                        errors.append(ErrorItem(message=f"Navigation failed: {str(e2)[:50]}", phase="render"))
+                        return metadata, sections, errors, interactions
                 
-                if not existing_metadata or not existing_metadata.title:
-                    metadata = extract_metadata(tree, url)
+                await wait_for_dom_settle(page, await mark_dom(page), timeout=1000, need_change=False)
                 
-                js_sections = extract_sections(tree, url)
+                await click_tabs(page, interactions, errors)
+                await click_load_more(page, interactions, errors)
+                await perform_scrolls(page, interactions, errors, scroll_count=3)
                 
-                if js_sections:
-                    existing_ids = {s.id for s in sections}
-                    for sec in js_sections:
-                        if sec.id not in existing_ids:
-                            sections.append(sec)
-                        else:
-                            for i, existing in enumerate(sections):
-                                if existing.id == sec.id:
-                                    if len(sec.content.text) > len(existing.content.text):
-                                        sections[i] = sec
-                                    break
+                await follow_pagination(page, interactions, errors, max_pages=3)
                 
-            except Exception as e:
-                errors.append(ErrorItem(message=f"Parse error: {str(e)[:50]}", phase="parse"))
-            
-            await context.close()
+                try:
+                    rendered_metadata, js_sections = await extract_rendered(page, url)
+                    
+                    if not existing_metadata or not existing_metadata.title:
+                        metadata = rendered_metadata
+                    
+                    if js_sections:
+                        merge_sections(sections, js_sections)
+                    
+                except Exception as e:
+                    errors.append(ErrorItem(message=f"Parse error: {str(e)[:50]}", phase="parse"))
+            finally:
+                await page.close()
             
     except Exception as e:
         errors.append(ErrorItem(message=f"Browser error: {str(e)[:50]}", phase="render"))
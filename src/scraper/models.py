@@ -1,28 +1,28 @@
-from pydantic import BaseModel, Field
-from typing import List, Optional
-from datetime import datetime
+import msgspec
+from pydantic import BaseModel
+from typing import List
 
 
-class LinkItem(BaseModel):
+class LinkItem(msgspec.Struct):
     text: str
     href: str
 
 
-class ImageItem(BaseModel):
+class ImageItem(msgspec.Struct):
     src: str
     alt: str
 
 
-class SectionContent(BaseModel):
-    headings: List[str] = Field(default_factory=list)
+class SectionContent(msgspec.Struct):
+    headings: List[str] = msgspec.field(default_factory=list)
     text: str = ""
-    links: List[LinkItem] = Field(default_factory=list)
-    images: List[ImageItem] = Field(default_factory=list)
-    lists: List[List[str]] = Field(default_factory=list)
-    tables: List[List[List[str]]] = Field(default_factory=list)
+    links: List[LinkItem] = msgspec.field(default_factory=list)
+    images: List[ImageItem] = msgspec.field(default_factory=list)
+    lists: List[List[str]] = msgspec.field(default_factory=list)
+    tables: List[List[List[str]]] = msgspec.field(default_factory=list)
 
 
-class Section(BaseModel):
+class Section(msgspec.Struct):
     id: str
     type: str
     label: str
@@ -32,34 +32,34 @@ class Section(BaseModel):
     truncated: bool = False
 
 
-class MetaData(BaseModel):
+class MetaData(msgspec.Struct):
     title: str = ""
     description: str = ""
     language: str = ""
     canonical: str = ""
 
 
-class Interactions(BaseModel):
-    clicks: List[str] = Field(default_factory=list)
+class Interactions(msgspec.Struct):
+    clicks: List[str] = msgspec.field(default_factory=list)
     scrolls: int = 0
-    pages: List[str] = Field(default_factory=list)
+    pages: List[str] = msgspec.field(default_factory=list)
 
 
-class ErrorItem(BaseModel):
+class ErrorItem(msgspec.Struct):
     message: str
     phase: str
 
 
-class ScrapeResult(BaseModel):
+class ScrapeResult(msgspec.Struct, kw_only=True):
     url: str
     scrapedAt: str
     meta: MetaData
-    sections: List[Section] = Field(default_factory=list)
+    sections: List[Section] = msgspec.field(default_factory=list)
     interactions: Interactions
-    errors: List[ErrorItem] = Field(default_factory=list)
+    errors: List[ErrorItem] = msgspec.field(default_factory=list)
 
 
-class ScrapeResponse(BaseModel):
+class ScrapeResponse(msgspec.Struct):
     result: ScrapeResult
 
 
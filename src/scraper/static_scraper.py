@@ -1,6 +1,7 @@
+import asyncio
 import httpx
-from selectolax.parser import HTMLParser
-from urllib.parse import urljoin, urlparse
+from selectolax.lexbor import LexborHTMLParser as HTMLParser
+from urllib.parse import urljoin, urlsplit
 from typing import List, Tuple, Optional
 from .models import (
     MetaData, Section, SectionContent, LinkItem, ImageItem, ErrorItem
@@ -19,8 +20,43 @@ NOISE_SELECTORS = [
     'script', 'style', 'noscript', 'iframe',
     '[hidden]', '[aria-hidden="true"]'
 ]
+NOISE_SELECTOR_GROUP = ",".join(NOISE_SELECTORS)
 
 SECTION_SELECTORS = ['header', 'nav', 'main', 'section', 'article', 'aside', 'footer']
+SECTION_SELECTOR_GROUP = ",".join(SECTION_SELECTORS)
+
+# The grouped css() queries these replace ('h1, h2, ...', 'ul, ol',
+# 'th, td') returned matches selector by selector, so every h1 came before
+# any h2, every <ul> before any <ol>, and a row's <th> cells before its <td>
+# cells. Content is bucketed by tag in this order to keep that output.
+HEADING_TAGS = ('h1', 'h2', 'h3', 'h4', 'h5', 'h6')
+LIST_TAGS = ('ul', 'ol')
+TABLE_CELL_TAGS = ('th', 'td')
+
+VOID_TAGS = frozenset({
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
+    'link', 'meta', 'param', 'source', 'track', 'wbr'
+})
+
+RAW_HTML_LIMIT = 1000
+FALLBACK_TEXT_LIMIT = 500
+
+MAX_LINKS = 50
+MAX_IMAGES = 20
+MAX_LISTS = 10
+MAX_TABLES = 5
+
+# (keyword, type) pairs in the priority order of the type checks. 'navigation'
+# and 'footer' are left out, since 'nav' and 'foot' already match them.
+SECTION_KEYWORDS = (
+    ('hero', 'hero'), ('banner', 'hero'), ('jumbotron', 'hero'), ('splash', 'hero'),
+    ('nav', 'nav'), ('menu', 'nav'),
+    ('foot', 'footer'),
+    ('faq', 'faq'), ('accordion', 'faq'), ('question', 'faq'),
+    ('price', 'pricing'), ('pricing', 'pricing'), ('plan', 'pricing'),
+    ('grid', 'grid'), ('cards', 'grid'), ('gallery', 'grid'),
+    ('list', 'list'), ('items', 'list'),
+)
 
 SECTION_TYPE_MAP = {
     'header': 'hero',
@@ -34,27 +70,45 @@ SECTION_TYPE_MAP = {
 
 
 def extract_metadata(tree: HTMLParser, url: str) -> MetaData:
+    title_tag = og_title = desc_tag = canonical_tag = None
+    
+    # The metadata tags live in a small <head>, so one walk over it beats a
+    # separate selector query per tag. Only the first match of each is kept.
+    head = tree.head or tree.root
+    if head is not None:
+        for node in head.traverse(include_text=False):
+            tag = node.tag
+            if tag == 'title':
+                if title_tag is None:
+                    title_tag = node
+            elif tag == 'meta':
+                attrs = node.attributes
+                if og_title is None and attrs.get('property') == 'og:title':
+                    og_title = node
+                elif desc_tag is None and attrs.get('name') == 'description':
+                    desc_tag = node
+            elif tag == 'link':
+                if canonical_tag is None and node.attributes.get('rel') == 'canonical':
+                    canonical_tag = node
+    
     title = ""
-    title_tag = tree.css_first('title')
     if title_tag:
         title = title_tag.text(strip=True)
     
-    og_title = tree.css_first('meta[property="og:title"]')
     if og_title and og_title.attributes.get('content'):
         title = og_title.attributes.get('content', title)
     
     description = ""
-    desc_tag = tree.css_first('meta[name="description"]')
     if desc_tag:
         description = desc_tag.attributes.get('content', '')
     
     language = ""
-    html_tag = tree.css_first('html')
-    if html_tag:
+    # Lexbor selectors only match descendants, so read <html> off the root node.
+    html_tag = tree.root
+    if html_tag and html_tag.tag == 'html':
         language = html_tag.attributes.get('lang', '')
     
     canonical = ""
-    canonical_tag = tree.css_first('link[rel="canonical"]')
     if canonical_tag:
         canonical = canonical_tag.attributes.get('href', '')
     if canonical:
@@ -68,85 +122,147 @@ def extract_metadata(tree: HTMLParser, url: str) -> MetaData:
     )
 
 
+def _absolute_url(href: str, base_url: str, scheme_prefix: str) -> str:
+    if href.startswith(('http://', 'https://')):
+        return href
+    if href.startswith('//'):
+        return scheme_prefix + href
+    return urljoin(base_url, href)
+
+
 def make_absolute_url(href: str, base_url: str) -> str:
     if not href:
         return ""
-    if href.startswith(('http://', 'https://', '//')):
-        if href.startswith('//'):
-            parsed = urlparse(base_url)
-            return f"{parsed.scheme}:{href}"
-        return href
-    return urljoin(base_url, href)
+    return _absolute_url(href, base_url, f"{urlsplit(base_url).scheme}:")
+
+
+def _enclosing(node, root_id: int, containers: dict):
+    """Yield the collected containers that enclose ``node`` below the section root."""
+    parent = node.parent
+    while parent is not None and parent.mem_id != root_id:
+        container = containers.get(parent.mem_id)
+        if container is not None:
+            yield container
+        parent = parent.parent
+
+
+def iter_text(element):
+    """Yield the stripped text of each text node under ``element`` in document order.
+
+    ``"".join(iter_text(node))`` equals ``node.text(strip=True)``, but
+    selectolax builds that string by repeated concatenation, which goes
+    quadratic on large subtrees. Iterating lets callers stop early or just
+    count characters.
+    """
+    for node in element.traverse(include_text=True):
+        if node.tag == '-text':
+            text = (node.text_content or "").strip()
+            if text:
+                yield text
+
+
+def _flatten(groups: dict) -> list:
+    return [item for items in groups.values() for item in items]
 
 
 def extract_section_content(element, base_url: str) -> SectionContent:
-    headings = []
-    for h in element.css('h1, h2, h3, h4, h5, h6'):
-        text = h.text(strip=True)
-        if text:
-            headings.append(text)
-    
+    headings = {tag: [] for tag in HEADING_TAGS}
     text_parts = []
-    for p in element.css('p'):
-        txt = p.text(strip=True)
-        if txt:
-            text_parts.append(txt)
-    
-    if not text_parts:
-        all_text = element.text(strip=True)
-        if all_text:
-            text_parts.append(all_text[:500])
-    
     links = []
-    for a in element.css('a[href]'):
-        href = a.attributes.get('href', '')
-        link_text = a.text(strip=True)
-        if href and not href.startswith(('#', 'javascript:', 'mailto:', 'tel:')):
-            links.append(LinkItem(
-                text=link_text or href,
-                href=make_absolute_url(href, base_url)
-            ))
-    
     images = []
-    for img in element.css('img[src]'):
-        src = img.attributes.get('src', '')
-        alt = img.attributes.get('alt', '')
-        if src:
-            images.append(ImageItem(
-                src=make_absolute_url(src, base_url),
-                alt=alt or ""
-            ))
+    list_groups = {tag: [] for tag in LIST_TAGS}
+    lists = {}
+    tables = {}
+    rows = {}
+    root_id = element.mem_id
+    scheme_prefix = f"{urlsplit(base_url).scheme}:"
     
-    lists = []
-    for ul in element.css('ul, ol'):
-        items = []
-        for li in ul.css('li'):
-            item_text = li.text(strip=True)
-            if item_text:
-                items.append(item_text)
-        if items:
-            lists.append(items)
-    
-    tables = []
-    for table in element.css('table'):
-        table_data = []
-        for tr in table.css('tr'):
-            row = []
-            for cell in tr.css('th, td'):
-                cell_text = cell.text(strip=True)
-                row.append(cell_text)
-            if row:
+    for node in element.traverse(include_text=False):
+        if node.mem_id == root_id:
+            continue
+        tag = node.tag
+        
+        if tag in headings:
+            text = node.text(strip=True)
+            if text:
+                headings[tag].append(text)
+        elif tag == 'p':
+            txt = node.text(strip=True)
+            if txt:
+                text_parts.append(txt)
+        elif tag == 'a':
+            if len(links) >= MAX_LINKS:
+                continue
+            attrs = node.attributes
+            if 'href' not in attrs:
+                continue
+            href = attrs.get('href', '')
+            if href and not href.startswith(('#', 'javascript:', 'mailto:', 'tel:')):
+                link_text = node.text(strip=True)
+                links.append(LinkItem(
+                    text=link_text or href,
+                    href=_absolute_url(href, base_url, scheme_prefix)
+                ))
+        elif tag == 'img':
+            if len(images) >= MAX_IMAGES:
+                continue
+            attrs = node.attributes
+            src = attrs.get('src', '')
+            alt = attrs.get('alt', '')
+            if src:
+                images.append(ImageItem(
+                    src=_absolute_url(src, base_url, scheme_prefix),
+                    alt=alt or ""
+                ))
+        elif tag in list_groups:
+            items = []
+            lists[node.mem_id] = items
+            list_groups[tag].append(items)
+        elif tag == 'li':
+            item_text = None
+            for items in _enclosing(node, root_id, lists):
+                if item_text is None:
+                    item_text = node.text(strip=True)
+                if item_text:
+                    items.append(item_text)
+        elif tag == 'table':
+            tables[node.mem_id] = []
+        elif tag == 'tr':
+            row = {cell_tag: [] for cell_tag in TABLE_CELL_TAGS}
+            rows[node.mem_id] = row
+            for table_data in _enclosing(node, root_id, tables):
                 table_data.append(row)
-        if table_data:
-            tables.append(table_data)
+        elif tag in TABLE_CELL_TAGS:
+            cell_text = None
+            for row in _enclosing(node, root_id, rows):
+                if cell_text is None:
+                    cell_text = node.text(strip=True)
+                row[tag].append(cell_text)
+    
+    if not text_parts:
+        fallback = []
+        size = 0
+        for text in iter_text(element):
+            fallback.append(text)
+            size += len(text)
+            if size >= FALLBACK_TEXT_LIMIT:
+                break
+        if fallback:
+            text_parts.append("".join(fallback)[:FALLBACK_TEXT_LIMIT])
+    
+    table_rows = []
+    for table_data in tables.values():
+        cells = [row for row in map(_flatten, table_data) if row]
+        if cells:
+            table_rows.append(cells)
     
     return SectionContent(
-        headings=headings,
+        headings=_flatten(headings),
         text=" ".join(text_parts),
-        links=links[:50],
-        images=images[:20],
-        lists=lists[:10],
-        tables=tables[:5]
+        links=links,
+        images=images,
+        lists=[items for items in _flatten(list_groups) if items][:MAX_LISTS],
+        tables=table_rows[:MAX_TABLES]
     )
 
 
@@ -162,20 +278,9 @@ def determine_section_type(element, content: SectionContent) -> str:
     element_id = element.attributes.get('id', '').lower()
     combined = classes + " " + element_id
     
-    if any(x in combined for x in ['hero', 'banner', 'jumbotron', 'splash']):
-        return 'hero'
-    if any(x in combined for x in ['nav', 'menu', 'navigation']):
-        return 'nav'
-    if any(x in combined for x in ['footer', 'foot']):
-        return 'footer'
-    if any(x in combined for x in ['faq', 'accordion', 'question']):
-        return 'faq'
-    if any(x in combined for x in ['price', 'pricing', 'plan']):
-        return 'pricing'
-    if any(x in combined for x in ['grid', 'cards', 'gallery']):
-        return 'grid'
-    if any(x in combined for x in ['list', 'items']):
-        return 'list'
+    for keyword, section_type in SECTION_KEYWORDS:
+        if keyword in combined:
+            return section_type
     
     return base_type
 
@@ -197,57 +302,130 @@ def generate_label(element, content: SectionContent) -> str:
 
 
 def remove_noise(tree: HTMLParser) -> None:
-    for selector in NOISE_SELECTORS:
-        try:
-            for node in tree.css(selector):
-                node.decompose()
-        except Exception:
-            pass
+    try:
+        nodes = tree.css(NOISE_SELECTOR_GROUP)
+    except Exception:
+        return
+    
+    # Grouped matches come back selector by selector rather than in document
+    # order, and a node matching several selectors is returned once per
+    # selector. Collect the outermost matches before touching the tree:
+    # decomposing frees the whole subtree, so no match may be inspected, let
+    # alone decomposed, after an enclosing match is gone.
+    matched_ids = {node.mem_id for node in nodes}
+    roots = {}
+    for node in nodes:
+        if node.mem_id in roots:
+            continue
+        parent = node.parent
+        while parent is not None and parent.mem_id not in matched_ids:
+            parent = parent.parent
+        if parent is None:
+            roots[node.mem_id] = node
+    
+    for node in roots.values():
+        node.decompose()
+
+
+def _start_tag(node) -> str:
+    # Attribute names come back lowercased, so SVG's viewBox is written as
+    # viewbox; element.html keeps the adjusted case.
+    attrs = []
+    for name, value in node.attributes.items():
+        if value is None:
+            attrs.append(f" {name}")
+        else:
+            value = value.replace('&', '&amp;').replace('"', '&quot;').replace('\xa0', '&nbsp;')
+            attrs.append(f' {name}="{value}"')
+    return f"<{node.tag}{''.join(attrs)}>"
+
+
+def _write_html_prefix(node, parts: List[str], budget: int) -> int:
+    if node.tag == 'template':
+        html = node.html or ""
+        parts.append(html)
+        return budget - len(html)
+    
+    start = _start_tag(node)
+    parts.append(start)
+    budget -= len(start)
+    if node.tag in VOID_TAGS:
+        return budget
+    
+    for child in node.iter(include_text=True):
+        if budget < 0:
+            return budget
+        if child.tag.startswith('-'):
+            html = child.html or ""
+            parts.append(html)
+            budget -= len(html)
+        else:
+            budget = _write_html_prefix(child, parts, budget)
+    
+    end = f"</{node.tag}>"
+    parts.append(end)
+    return budget - len(end)
+
+
+def truncated_html(element, limit: int = RAW_HTML_LIMIT) -> Tuple[str, bool]:
+    """Serialize only as much of ``element`` as the ``limit``-char preview needs.
+
+    ``element.html`` would serialize the whole subtree, which for a large
+    <main> can be hundreds of KB, just to keep the first ``limit`` characters.
+    """
+    parts = []
+    _write_html_prefix(element, parts, limit)
+    raw_html = "".join(parts)
+    if len(raw_html) > limit:
+        return raw_html[:limit] + "...", True
+    return raw_html, False
+
+
+def make_section(
+    element,
+    content: SectionContent,
+    url: str,
+    raw_html: str,
+    truncated: bool,
+    section_counts: dict
+) -> Section:
+    section_type = determine_section_type(element, content)
+    label = generate_label(element, content)
+    
+    if section_type not in section_counts:
+        section_counts[section_type] = 0
+    section_id = f"{section_type}-{section_counts[section_type]}"
+    section_counts[section_type] += 1
+    
+    return Section(
+        id=section_id,
+        type=section_type,
+        label=label,
+        sourceUrl=url,
+        content=content,
+        rawHtml=raw_html,
+        truncated=truncated
+    )
 
 
 def extract_sections(tree: HTMLParser, url: str) -> List[Section]:
     sections = []
     section_counts = {}
     
-    for selector in SECTION_SELECTORS:
-        for element in tree.css(selector):
-            content = extract_section_content(element, url)
-            
-            if not content.text and not content.headings and not content.links:
-                continue
-            
-            section_type = determine_section_type(element, content)
-            label = generate_label(element, content)
-            
-            if section_type not in section_counts:
-                section_counts[section_type] = 0
-            section_id = f"{section_type}-{section_counts[section_type]}"
-            section_counts[section_type] += 1
-            
-            raw_html = element.html or ""
-            truncated = False
-            if len(raw_html) > 1000:
-                raw_html = raw_html[:1000] + "..."
-                truncated = True
-            
-            sections.append(Section(
-                id=section_id,
-                type=section_type,
-                label=label,
-                sourceUrl=url,
-                content=content,
-                rawHtml=raw_html,
-                truncated=truncated
-            ))
+    for element in tree.css(SECTION_SELECTOR_GROUP):
+        content = extract_section_content(element, url)
+        
+        if not content.text and not content.headings and not content.links:
+            continue
+        
+        raw_html, truncated = truncated_html(element)
+        sections.append(make_section(element, content, url, raw_html, truncated, section_counts))
     
     if not sections:
-        body = tree.css_first('body')
+        body = tree.body
         if body:
             content = extract_section_content(body, url)
-            raw_html = body.html or ""
-            truncated = len(raw_html) > 1000
-            if truncated:
-                raw_html = raw_html[:1000] + "..."
+            raw_html, truncated = truncated_html(body)
             
             sections.append(Section(
                 id="body-0",
@@ -263,29 +441,64 @@ def extract_sections(tree: HTMLParser, url: str) -> List[Section]:
 
 
 def get_text_content_length(tree: HTMLParser) -> int:
-    body = tree.css_first('body')
+    body = tree.body
     if body:
-        text = body.text(strip=True)
-        return len(text)
+        return sum(len(text) for text in iter_text(body))
     return 0
 
 
-async def static_scrape(url: str) -> Tuple[MetaData, List[Section], List[ErrorItem], str, bool]:
+def create_http_transport() -> httpx.AsyncHTTPTransport:
+    return httpx.AsyncHTTPTransport(
+        http2=True,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=100),
+    )
+
+
+def create_http_client(transport: Optional[httpx.AsyncHTTPTransport] = None) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        transport=transport or create_http_transport(),
+        timeout=30.0,
+        follow_redirects=True,
+        headers={
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+        }
+    )
+
+
+def parse_static(html_content: str, url: str) -> Tuple[MetaData, List[Section], bool]:
+    tree = HTMLParser(html_content)
+    remove_noise(tree)
+    
+    needs_js = get_text_content_length(tree) < 500
+    
+    metadata = extract_metadata(tree, url)
+    sections = extract_sections(tree, url)
+    
+    if not sections or all(not s.content.text for s in sections):
+        needs_js = True
+    
+    return metadata, sections, needs_js
+
+
+async def static_scrape(
+    url: str,
+    transport: Optional[httpx.AsyncHTTPTransport] = None
+) -> Tuple[MetaData, List[Section], List[ErrorItem], str, bool]:
     errors = []
-    needs_js = False
     html_content = ""
     
     try:
-        async with httpx.AsyncClient(
-            timeout=30.0,
-            follow_redirects=True,
-            headers={
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            }
-        ) as client:
-            response = await client.get(url)
-            response.raise_for_status()
-            html_content = response.text
+        if transport is None:
+            async with create_http_client() as client:
+                response = await client.get(url)
+        else:
+            # Only the connection pool is shared. Each scrape gets its own
+            # client, and so its own cookie jar: cookies set along a redirect
+            # chain are kept for that chain but never leak into other scrapes.
+            # The client is not closed, since that would close the transport.
+            response = await create_http_client(transport).get(url)
+        response.raise_for_status()
+        html_content = response.text
     except httpx.TimeoutException:
         errors.append(ErrorItem(message="Request timeout", phase="fetch"))
         return MetaData(), [], errors, "", True
@@ -297,19 +510,12 @@ async def static_scrape(url: str) -> Tuple[MetaData, List[Section], List[ErrorIt
         return MetaData(), [], errors, "", True
     
     try:
-        tree = HTMLParser(html_content)
-        remove_noise(tree)
-        
-        text_length = get_text_content_length(tree)
-        if text_length < 500:
-            needs_js = True
-        
-        metadata = extract_metadata(tree, url)
-        sections = extract_sections(tree, url)
-        
-        if not sections or all(not s.content.text for s in sections):
-            needs_js = True
-        
+        # Parsing and extraction are CPU-bound; keep them off the event loop
+        # so concurrent scrapes and the speculative render keep progressing.
+        loop = asyncio.get_running_loop()
+        metadata, sections, needs_js = await loop.run_in_executor(
+            None, parse_static, html_content, url
+        )
         return metadata, sections, errors, html_content, needs_js
         
     except Exception as e:
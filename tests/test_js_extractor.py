@@ -0,0 +1,173 @@
+import asyncio
+
+import pytest
+from playwright.async_api import async_playwright
+
+from src.scraper.js_scraper import (
+    EXTRACT_ARGS, EXTRACT_JS, LOAD_MORE_SELECTORS, build_rendered, find_visible, merge_sections,
+    parse_rendered
+)
+from src.scraper.models import Section, SectionContent
+
+URL = "https://example.com/page/"
+
+PAGES = [
+    """<html lang="en"><head><title>Sample</title>
+    <meta name="description" content="A description">
+    <link rel="canonical" href="/canon"></head><body>
+    <header class="hero"><h1>Welcome <b>home</b></h1>
+    <p>Intro <a href="/x">link x</a> text</p><img src="//cdn.example.com/a.png" alt="A"></header>
+    <div class="cookie-banner"><p>Accept cookies</p></div>
+    <nav><ul><li><a href="/a">A</a></li><li><a href="#top">Top</a></li></ul></nav>
+    <main><section class="pricing"><h2>Plans</h2>
+    <table><tr><th>Plan</th><th>Price</th></tr><tr><td>Basic</td><td>$1</td></tr></table>
+    <p>Para one.</p></section></main>
+    <footer><p>Footer stuff</p></footer></body></html>""",
+    # Headings, lists and cells come out grouped by tag, not in document order.
+    """<html><body><section><h3>Eyebrow</h3><h1>Main Title</h1>
+    <ol><li>first</li></ol><ul><li>bullet</li></ul>
+    <table><tr><td>1</td><th>Plan</th></tr></table></section></body></html>""",
+    # An astral character straddles the rawHtml cut of every section.
+    "<html><body><section><h2>E</h2><p>" + "a" * 975 + "\U0001F600" * 40 + "</p></section></body></html>",
+    # No section matches, so the body fallback text is cut mid-emoji.
+    "<html><body><div>" + "b" * 499 + "\U0001F600" * 600 + "</div></body></html>",
+]
+
+
+async def _in_page(html: str, action):
+    async with async_playwright() as p:
+        try:
+            browser = await p.chromium.launch()
+        except Exception as e:
+            pytest.skip(f"needs Chromium (playwright install chromium): {e}")
+        try:
+            page = await browser.new_page()
+            await page.set_content(html)
+            return await action(page)
+        finally:
+            await browser.close()
+
+
+async def _compare(html: str):
+    # Evaluated directly: extract_rendered would hide a script error behind
+    # its parse_rendered fallback.
+    extracted = await _in_page(html, lambda page: page.evaluate(EXTRACT_JS, EXTRACT_ARGS))
+    return build_rendered(extracted, URL), parse_rendered(html, URL)
+
+
+@pytest.mark.parametrize("html", PAGES)
+def test_live_dom_extraction_matches_static_parse(html):
+    (js_meta, js_sections), (meta, sections) = asyncio.run(_compare(html))
+
+    assert js_meta == meta
+    assert js_sections == sections
+
+
+def test_rendered_limits_count_code_points():
+    raw = "x" * 999 + "\U0001F600\U0001F600"
+    extracted = {
+        'meta': {'title': '', 'ogTitle': '', 'description': '', 'language': '', 'canonical': ''},
+        'sections': [],
+        'fallback': {
+            'tag': 'body',
+            'attributes': {'class': '', 'id': '', 'aria-label': ''},
+            'content': {
+                'headings': [], 'text': '', 'fallbackText': "y" * 499 + "\U0001F600" * 2,
+                'links': [], 'images': [], 'lists': [], 'tables': []
+            },
+            'rawHtml': raw,
+        },
+    }
+
+    _, sections = build_rendered(extracted, URL)
+
+    assert sections[0].rawHtml == raw[:1000] + "..."
+    assert sections[0].truncated
+    assert sections[0].content.text == "y" * 499 + "\U0001F600"
+
+
+def _content(**fields):
+    content = {
+        'headings': [], 'text': '', 'fallbackText': '',
+        'links': [], 'images': [], 'lists': [], 'tables': []
+    }
+    content.update(fields)
+    return content
+
+
+def test_build_rendered_matches_parse_rendered():
+    # The payload EXTRACT_JS returns for this page, written out by hand so
+    # the Python half is covered without a browser.
+    html = (
+        '<html lang="en"><head><title>T</title><meta property="og:title" content="OG">'
+        '<link rel="canonical" href="/c"></head><body>'
+        '<header class="hero"><h1>Hi</h1><p>Intro <a href="/x">x</a></p>'
+        '<img src="//cdn.example.com/a.png" alt="A"></header>'
+        '<footer><p>Bye</p></footer></body></html>'
+    )
+    attributes = {'class': '', 'id': '', 'aria-label': ''}
+    extracted = {
+        'meta': {'title': 'T', 'ogTitle': 'OG', 'description': '', 'language': 'en', 'canonical': '/c'},
+        'sections': [
+            {
+                'tag': 'header',
+                'attributes': {**attributes, 'class': 'hero'},
+                'content': _content(
+                    headings=['Hi'], text='Introx',
+                    links=[{'text': 'x', 'href': '/x'}],
+                    images=[{'src': '//cdn.example.com/a.png', 'alt': 'A'}]
+                ),
+                'rawHtml': '<header class="hero"><h1>Hi</h1><p>Intro <a href="/x">x</a></p>'
+                           '<img src="//cdn.example.com/a.png" alt="A"></header>',
+            },
+            {
+                'tag': 'footer',
+                'attributes': attributes,
+                'content': _content(text='Bye'),
+                'rawHtml': '<footer><p>Bye</p></footer>',
+            },
+        ],
+        'fallback': None,
+    }
+
+    assert build_rendered(extracted, URL) == parse_rendered(html, URL)
+
+
+def test_merge_sections_prefers_longer_rendered_text():
+    def section(section_id, text):
+        return Section(
+            id=section_id, type=section_id.split('-')[0], label=text, sourceUrl=URL,
+            content=SectionContent(text=text), rawHtml='', truncated=False
+        )
+
+    static = [section('hero-0', 'Loading'), section('list-0', 'Full static list')]
+    rendered = [section('hero-0', 'Welcome to the app'), section('list-0', 'Short'), section('faq-0', 'Q')]
+
+    merged = merge_sections(static, rendered)
+
+    assert [(s.id, s.content.text) for s in merged] == [
+        ('hero-0', 'Welcome to the app'), ('list-0', 'Full static list'), ('faq-0', 'Q')
+    ]
+
+
+def test_find_visible_matches_like_playwright_selectors():
+    html = """<html><body>
+    <button class="load-more">Load
+        more</button>
+    <button style="position: fixed; top: 0">Show more</button>
+    <button style="display: none">See more</button>
+    <div id="host"></div>
+    <script>
+        document.getElementById('host').attachShadow({mode: 'open'}).innerHTML =
+            '<button>View more</button>';
+    </script></body></html>"""
+
+    async def texts(page):
+        matches = await find_visible(page, LOAD_MORE_SELECTORS)
+        return [[await element.inner_text() for element, _ in hits] for hits in matches]
+
+    found = asyncio.run(_in_page(html, texts))
+
+    # The load-more button is claimed by its :has-text() selector, so the
+    # class selector does not report it a second time.
+    assert found[:5] == [['Load more'], ['Show more'], [], ['View more'], []]
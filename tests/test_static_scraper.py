@@ -0,0 +1,139 @@
+import asyncio
+
+import httpx
+import pytest
+
+from src.scraper.static_scraper import (
+    HTMLParser, determine_section_type, extract_section_content, generate_label, remove_noise,
+    static_scrape, truncated_html
+)
+
+PAGE = "<html><body><main><h1>Hi</h1><p>" + "word " * 200 + "</p></main></body></html>"
+
+
+def test_redirect_cookies_stay_within_one_scrape():
+    seen = []
+
+    def handler(request):
+        cookie = request.headers.get('cookie')
+        seen.append(cookie)
+        if cookie == 'session=1':
+            return httpx.Response(200, html=PAGE)
+        return httpx.Response(302, headers={'location': '/', 'set-cookie': 'session=1; Path=/'})
+
+    async def scrape_twice():
+        transport = httpx.MockTransport(handler)
+        return [await static_scrape("https://example.com/", transport) for _ in range(2)]
+
+    for _, sections, errors, _, _ in asyncio.run(scrape_twice()):
+        assert errors == []
+        assert sections
+    assert seen == [None, 'session=1', None, 'session=1']
+
+
+class _RecordingNode:
+    """Wraps a node so the test can see which nodes remove_noise decomposes."""
+
+    def __init__(self, node, decomposed):
+        self._node = node
+        self._decomposed = decomposed
+
+    @property
+    def mem_id(self):
+        return self._node.mem_id
+
+    @property
+    def parent(self):
+        parent = self._node.parent
+        return None if parent is None else _RecordingNode(parent, self._decomposed)
+
+    def decompose(self):
+        self._decomposed.append(self._node.tag)
+        self._node.decompose()
+
+
+class _RecordingTree:
+    def __init__(self, tree):
+        self._tree = tree
+        self.decomposed = []
+
+    def css(self, selector):
+        return [_RecordingNode(node, self.decomposed) for node in self._tree.css(selector)]
+
+
+def test_remove_noise_decomposes_only_outermost_matches():
+    # The cookie container is matched before the script, iframe and
+    # aria-hidden selectors it encloses; those must not be touched once it
+    # has been freed.
+    tree = HTMLParser(
+        '<body><div class="cookie-bar"><script>track()</script><iframe></iframe>'
+        '<span aria-hidden="true">x</span></div><p>Keep</p><script>a()</script>'
+        '<script>b()</script></body>'
+    )
+    recording = _RecordingTree(tree)
+
+    remove_noise(recording)
+
+    assert sorted(recording.decomposed) == ['div', 'script', 'script']
+    assert tree.body.html == '<body><p>Keep</p></body>'
+
+
+def test_section_content_groups_by_tag_like_grouped_selectors():
+    section = HTMLParser(
+        '<section><h3>Eyebrow</h3><h1>Main Title</h1>'
+        '<ol><li>first</li></ol><ul><li>bullet</li></ul>'
+        '<table><tr><td>1</td><th>Plan</th></tr></table></section>'
+    ).css_first('section')
+
+    content = extract_section_content(section, "https://example.com/")
+
+    assert content.headings == ['Main Title', 'Eyebrow']
+    assert generate_label(section, content) == 'Main Title'
+    assert content.lists == [['bullet'], ['first']]
+    assert content.tables == [[['Plan', '1']]]
+
+
+def test_section_type_keywords_keep_priority_order():
+    def section_type(html):
+        element = HTMLParser(html).css_first('section, div, header')
+        return determine_section_type(element, extract_section_content(element, "https://example.com/"))
+
+    assert section_type('<div class="site-footer nav-links"></div>') == 'nav'
+    assert section_type('<div class="pricing-cards"></div>') == 'pricing'
+    assert section_type('<section id="navigation-banner"></section>') == 'hero'
+    assert section_type('<div class="container mx-auto items-center"></div>') == 'list'
+    assert section_type('<header class="container"></header>') == 'hero'
+    assert section_type('<section class="content"></section>') == 'section'
+
+
+SERIALIZER_CASES = [
+    '<section data-x="a &amp; &quot;b&quot; &lt;c&gt;" title=\'it"s\' hidden><p>x</p></section>',
+    '<section><p>a&nbsp;b &amp; &lt;tag&gt;</p><p title="x&nbsp;y">z</p></section>',
+    '<section><br><img src="a.png" alt=""><input type="text" disabled><hr/><wbr></section>',
+    '<section><template><p>in &amp; template</p><br></template><p>after</p></section>',
+    '<section><textarea>\n<b>raw</b> &amp; text</textarea><pre>\nline</pre></section>',
+    '<section><!-- note --><p>a</p><!----></section>',
+    '<section><style>a > b { }</style><script>if (a < b && c) {}</script></section>',
+    '<section>' + '<p>para &amp; more</p>' * 200 + '</section>',
+]
+
+
+def _section(html):
+    return HTMLParser(f'<html><body>{html}</body></html>').css_first('section')
+
+
+@pytest.mark.parametrize("html", SERIALIZER_CASES)
+def test_truncated_html_matches_serialized_prefix(html):
+    element = _section(html)
+    full = element.html
+
+    expected = (full[:1000] + "...", True) if len(full) > 1000 else (full, False)
+    assert truncated_html(element) == expected
+
+
+def test_truncated_html_lowercases_svg_attribute_names():
+    element = _section('<section><svg viewBox="0 0 10 10"><path d="M0 0"/></svg></section>')
+
+    assert truncated_html(element) == (
+        '<section><svg viewbox="0 0 10 10"><path d="M0 0"></path></svg></section>', False
+    )